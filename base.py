@@ -4,6 +4,8 @@ from __future__ import annotations
 class FieldABC:
     """Abstract base class from which all Field classes inherit."""
 
+    __slots__ = ()
+
     parent = None
     name = None
     root = None
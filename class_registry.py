@@ -8,11 +8,18 @@ if typing.TYPE_CHECKING:
 
     SchemaType = typing.Type[Schema]
 
+
+class _Ambiguous:
+    """Marker for a class name registered from more than one module."""
+
+
+_AMBIGUOUS = _Ambiguous()
+
 # {
-#   <class_name>: <list of class objects>
-#   <module_path_to_class>: <list of class objects>
+#   <class_name>: <class object> or _AMBIGUOUS
+#   <module_path_to_class>: <class object>
 # }
-_registry = {}  # type: dict[str, list[SchemaType]]
+_registry = {}  # type: dict[str, SchemaType | _Ambiguous]
 
 
 def register(classname: str, cls: typing.Any) -> None:
@@ -28,8 +35,8 @@ def register(classname: str, cls: typing.Any) -> None:
         register('MyClass', MyClass)
         # Registry:
         # {
-        #   'MyClass': [path.to.MyClass],
-        #   'path.to.MyClass': [path.to.MyClass],
+        #   'MyClass': path.to.MyClass,
+        #   'path.to.MyClass': path.to.MyClass,
         # }
 
     """
@@ -38,37 +45,36 @@ def register(classname: str, cls: typing.Any) -> None:
     # Full module path to the class
     # e.g. user.schemas.UserSchema
     fullpath = ".".join([module, classname])
-    # If the class is already registered; need to check if the entries are
-    # in the same module as cls to avoid having multiple instances of the same
-    # class in the registry
-    if classname in _registry and not any(
-        each.__module__ == module for each in _registry[classname]
-    ):
-        _registry[classname].append(cls)
-    elif classname not in _registry:
-        _registry[classname] = [cls]
-
-    # Also register the full path
-    if fullpath not in _registry:
-        _registry.setdefault(fullpath, []).append(cls)
-    else:
-        # If fullpath does exist, replace existing entry
-        _registry[fullpath] = [cls]
+    # If the class name is already registered from another module, the short
+    # name becomes ambiguous and can only be looked up by its full path
+    existing = _registry.get(classname)
+    if existing is None:
+        _registry[classname] = cls
+    elif existing is not _AMBIGUOUS and existing.__module__ != module:
+        _registry[classname] = _AMBIGUOUS
+
+    # Also register the full path, replacing any existing entry
+    _registry[fullpath] = cls
     return None
 
 
+def is_registered(classname: str) -> bool:
+    """Return whether a class name or full path resolves to a single class."""
+    cls = _registry.get(classname)
+    return cls is not None and cls is not _AMBIGUOUS
+
+
 def get_class(classname: str) -> SchemaType:
     try:
-        classes = _registry[classname]
+        cls = _registry[classname]
     except KeyError as error:
         print("Class with name {!r} was not found".format(classname))
         raise APIException(
             detail='Contact admin for support'
         ) from error
-    if len(classes) > 1:
+    if cls is _AMBIGUOUS:
         print("Multiple classes with name {!r} were found.".format(classname))
         raise APIException(
             detail='Contact admin for support'
         )
-    else:
-        return _registry[classname][0]
+    return cls
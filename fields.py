@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import copy
 import datetime as dt
+import functools
 import numbers
 import typing
 import uuid
+import weakref
 
 from rest_framework.exceptions import APIException, ParseError, ValidationError
 
@@ -48,6 +50,17 @@ class Field(FieldABC):
     :param dict error_messages: Overrides for `Field.default_error_messages`.
     """
 
+    __slots__ = (
+        "validators",
+        "required",
+        "parent",
+        "name",
+        "root",
+        "_compiled_validate",
+        "_load_default",
+        "_default_is_callable",
+    )
+
     def __init__(
         self,
         *,
@@ -75,10 +88,24 @@ class Field(FieldABC):
             )
 
         self.required = required
+        self._compiled_validate = None
+        self.parent = None
+        self.name = None
+        self.root = None
 
     def __deepcopy__(self, memo):
         return copy.copy(self)
 
+    @property
+    def load_default(self):
+        return self._load_default
+
+    @load_default.setter
+    def load_default(self, value):
+        # Decide once whether the default has to be called when used
+        self._load_default = value
+        self._default_is_callable = callable(value)
+
     def get_value(self, obj, attr, accessor=None, default=missing_):
         """Return the value for a given key from an object.
 
@@ -92,19 +119,20 @@ class Field(FieldABC):
         return accessor_func(obj, attr, default)
 
     def _validate(self, value, name):
-        self._validate_all(value, name)
+        validate_all = self._compiled_validate or self._compile_validators()
+        validate_all(value, name)
 
-    @property
-    def _validate_all(self):
-        return And(*self.validators)
+    def _compile_validators(self):
+        """Build the composite validator once and cache it on the field."""
+        self._compiled_validate = And(*self.validators)
+        return self._compiled_validate
 
     def _validate_missing(self, value):
         """Validate missing values. Raise a :exc:`ValidationError` if
-        `value` should be considered missing.
+        the field is required. Only called once `value` is known to be
+        missing (``missing`` or `None`).
         """
-        if ((value is missing_) or (value is None)) and self.required:
-            if self.load_default:
-                return
+        if self.required and not self.load_default:
             raise ParseError(
                 detail=f'Field {self.name} is required'
             )
@@ -123,13 +151,16 @@ class Field(FieldABC):
         :param data: The raw input data passed to `Schema.load`.
         :param kwargs: Field-specific keyword arguments.
 `       """
-        self._validate_missing(value)
-        if ((value is missing_) or (value == '') or (value is None)):
-            _miss = self.load_default
-            return _miss() if callable(_miss) else _miss
-        output = self._deserialize(value, attr, data, **kwargs)
-        self._validate(value=output, name=self.name)
-        return output
+        if (value is missing_) or (value is None):
+            self._validate_missing(value)
+        elif not isinstance(value, str) or value:
+            output = self._deserialize(value, attr, data, **kwargs)
+            self._validate(value=output, name=self.name)
+            return output
+        # Missing, `None` or empty string: fall back to the default
+        if self._default_is_callable:
+            return self._load_default()
+        return self._load_default
 
     def _bind_to_schema(self, field_name, schema):
         """Update field with values from its parent schema. Called by
@@ -138,12 +169,14 @@ class Field(FieldABC):
         :param str field_name: Field name set in schema.
         :param Schema|Field schema: Parent object.
         """
-        self.parent = self.parent or schema
-        self.name = self.name or field_name
-        self.root = self.root or (
-            self.parent.root if isinstance(
-                self.parent, FieldABC) else self.parent
-        )
+        if self.parent is None:
+            self.parent = schema
+        if self.name is None:
+            self.name = field_name
+        if self.root is None:
+            parent = self.parent
+            # Fields nested in a field share the root of their parent field
+            self.root = parent.root if isinstance(parent, FieldABC) else parent
 
     def _deserialize(
         self,
@@ -172,12 +205,30 @@ class Nested(Field):
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
+    __slots__ = ("nested", "many", "_schema")
+
+    #: Schema instances shared by every `Nested` field, keyed by ``(schema_class, many)``
+    _schema_cache = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+    # Keys of the schemas being built by `_bind_to_schema`, to break reference cycles
+    _schema_resolving = set()  # type: typing.Set[typing.Tuple[type, bool]]
+
     def __init__(self, nested: SchemaABC | type | str | typing.Callable[[], SchemaABC], *, many: bool = False, **kwargs,):
         self.nested = nested
         self.many = many
         self._schema = None  # Cached Schema instance
         super().__init__(**kwargs)
 
+    def _bind_to_schema(self, field_name, schema):
+        super()._bind_to_schema(field_name, schema)
+        nested = self.nested
+        # Callables and class names not registered yet are resolved on first access
+        if self._schema is None and not (
+            callable(nested) and not isinstance(nested, type)
+        ) and not (
+            isinstance(nested, str) and not class_registry.is_registered(nested)
+        ):
+            self._schema = self._resolve_schema(nested, defer_cycles=True)
+
     @property
     def schema(self):
         if not self._schema:
@@ -186,22 +237,43 @@ class Nested(Field):
                 nested = self.nested()
             else:
                 nested = self.nested
-
-            if isinstance(nested, SchemaABC):
-                self._schema = copy.copy(nested)
-                self._schema._init_fields()
-            else:
-                if isinstance(nested, type) and issubclass(nested, SchemaABC):
-                    schema_class = nested
-                elif isinstance(nested, str):
-                    schema_class = class_registry.get_class(nested)
-                else:
-                    raise APIException(
-                        detail='Contact admin for support'
-                    )
-                self._schema = schema_class(many=self.many)
+            self._schema = self._resolve_schema(nested)
         return self._schema
 
+    def _resolve_schema(self, nested, *, defer_cycles: bool = False):
+        """Return a ready-to-use schema instance for ``nested``.
+
+        :param nested: `Schema` instance, class or class name.
+        :param defer_cycles: Return `None` instead of building a schema that is
+            already being built, e.g. for a self-referencing schema.
+        """
+        if isinstance(nested, SchemaABC):
+            nested_schema = copy.copy(nested)
+            nested_schema._init_fields()
+            return nested_schema
+
+        if isinstance(nested, type) and issubclass(nested, SchemaABC):
+            schema_class = nested
+        elif isinstance(nested, str):
+            schema_class = class_registry.get_class(nested)
+        else:
+            raise APIException(
+                detail='Contact admin for support'
+            )
+
+        key = (schema_class, self.many)
+        nested_schema = self._schema_cache.get(key)
+        if nested_schema is None:
+            if defer_cycles and key in self._schema_resolving:
+                return None
+            self._schema_resolving.add(key)
+            try:
+                nested_schema = schema_class(many=self.many)
+            finally:
+                self._schema_resolving.discard(key)
+            self._schema_cache[key] = nested_schema
+        return nested_schema
+
     def _deserialize(self, value, attr, data, **kwargs):
         many = self.schema.many or self.many
         if many and not utils.is_collection(value):
@@ -223,13 +295,15 @@ class List(Field):
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
+    __slots__ = ("inner",)
+
     def __init__(self, cls_or_instance: Field | type, **kwargs):
         super().__init__(**kwargs)
         self.inner = resolve_field_instance(cls_or_instance)
 
     def _bind_to_schema(self, field_name, schema):
         super()._bind_to_schema(field_name, schema)
-        self.inner = copy.deepcopy(self.inner)
+        self.inner = copy.copy(self.inner)
         self.inner._bind_to_schema(field_name, self)
 
     def _deserialize(self, value, attr, data, **kwargs) -> list[typing.Any]:
@@ -238,10 +312,20 @@ class List(Field):
                 detail=f'Field {self.name} must be iterable'
             )
 
+        if not isinstance(value, (list, tuple)):
+            # Iterators can only be consumed once
+            value = list(value)
+        inner_deserialize = self.inner.deserialize
+        try:
+            return [inner_deserialize(each, **kwargs) for each in value]
+        except ValidationError:
+            pass
+
+        # Run again item by item to report the index of the invalid one
         result = []
         for idx, each in enumerate(value):
             try:
-                result.append(self.inner.deserialize(each, **kwargs))
+                result.append(inner_deserialize(each, **kwargs))
             except ValidationError as error:
                 raise ValidationError(
                     detail=f'Field {self.name}[{idx + 1}]: {error.detail[0]}'
@@ -255,6 +339,8 @@ class String(Field):
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
+    __slots__ = ("upper_case",)
+
     def __init__(self, *, upper_case: bool | None = False, **kwargs):
         super().__init__(**kwargs)
         self.upper_case = upper_case
@@ -287,13 +373,15 @@ class ListString(String):
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
+    __slots__ = ("inner",)
+
     def __init__(self, cls_or_instance: Field | type, **kwargs):
         super().__init__(**kwargs)
         self.inner = resolve_field_instance(cls_or_instance)
 
     def _bind_to_schema(self, field_name, schema):
         super()._bind_to_schema(field_name, schema)
-        self.inner = copy.deepcopy(self.inner)
+        self.inner = copy.copy(self.inner)
         self.inner._bind_to_schema(field_name, self)
 
     @staticmethod
@@ -333,11 +421,16 @@ class ListString(String):
 
 
 class UUID(String):
+    __slots__ = ()
+
     def _validated(self, value) -> uuid.UUID | None:
         if value is None:
             return None
+        value_type = type(value)
+        if value_type is uuid.UUID:
+            return value
         try:
-            return uuid.UUID(str(value))
+            return uuid.UUID(value if value_type is str else str(value))
         except (ValueError, AttributeError, TypeError) as error:
             raise ValidationError(
                 detail=f'Expect field {self.name} is an uuid'
@@ -354,6 +447,8 @@ class Float(Field):
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
+    __slots__ = ()
+
     num_type = float  # type: typing.Type
 
     def _format_num(self, value) -> typing.Any:
@@ -380,12 +475,15 @@ class Float(Field):
 class Integer(Float):
     """An integer field."""
 
+    __slots__ = ()
+
     num_type = int
 
     def _validated(self, value):
-        if isinstance(value, numbers.Number) and isinstance(
-            value, numbers.Integral
-        ):
+        value_type = type(value)
+        if value_type is int:
+            return value
+        if value_type is not str and isinstance(value, numbers.Integral):
             return super()._validated(value)
         elif isinstance(value, str):
             try:
@@ -402,8 +500,13 @@ class Integer(Float):
 class Boolean(Field):
     """A boolean field. """
 
-    truthy = {"T", "TRUE", "Y", "YES", "1", 1, True, }
-    falsy = {"F", "FALSE", "N", "NO", "0", 0, 0.0, False, }
+    __slots__ = ()
+
+    truthy = frozenset(("T", "TRUE", "Y", "YES", "1"))
+    falsy = frozenset(("F", "FALSE", "N", "NO", "0"))
+    # Non-string inputs; `1`/`True` and `0`/`0.0`/`False` hash alike
+    _truthy_nonstr = frozenset((1, True))
+    _falsy_nonstr = frozenset((0, 0.0, False))
 
     def _deserialize(self, value, attr, data, **kwargs):
         if value is None:
@@ -411,11 +514,18 @@ class Boolean(Field):
 
         if isinstance(value, str):
             value = value.upper()
-
-        if value in self.truthy:
-            return True
-        elif value in self.falsy:
-            return False
+            if value in self.truthy:
+                return True
+            elif value in self.falsy:
+                return False
+        else:
+            try:
+                if value in self._truthy_nonstr:
+                    return True
+                elif value in self._falsy_nonstr:
+                    return False
+            except TypeError:
+                pass
         raise ValidationError(
             detail=f'Field {self.name} must be a boolean value'
         )
@@ -427,6 +537,8 @@ class DateTime(Field):
     :param format: Either ``"iso"`` (for ISO8601), or a date format string. If `None`, defaults to "iso".
     """
 
+    __slots__ = ("format", "_deser_func")
+
     DESERIALIZATION_FUNCS = {
         "iso": utils.from_iso_datetime,
     }  # type: typing.Dict[str, typing.Callable[[str], typing.Any]]
@@ -438,23 +550,33 @@ class DateTime(Field):
     def __init__(self, format: str | None = None, **kwargs):
         super().__init__(**kwargs)
         self.format = format
+        self._deser_func = None
 
     def _bind_to_schema(self, field_name, schema):
         super()._bind_to_schema(field_name, schema)
-        self.format = (self.format or self.DEFAULT_FORMAT)
+        self._resolve_deser_func()
+
+    def _resolve_deser_func(self):
+        """Normalize the field's format, then pick its parsing function once
+        and cache it.
+        """
+        self.format = self.format or self.DEFAULT_FORMAT
+        func = self.DESERIALIZATION_FUNCS.get(self.format)
+        if func is None:
+            func = functools.partial(
+                self._make_object_from_format, data_format=self.format
+            )
+        self._deser_func = func
+        return func
 
     def _deserialize(self, value, attr, data, **kwargs):
         if not value:
             raise ValidationError(
                 detail=f'Field {self.name} is invalid'
             )
-        data_format = self.format or self.DEFAULT_FORMAT
-        func = self.DESERIALIZATION_FUNCS.get(data_format)
+        func = self._deser_func or self._resolve_deser_func()
         try:
-            if (func):
-                return func(value)
-            else:
-                return self._make_object_from_format(value, format)
+            return func(value)
         except (TypeError, AttributeError, ValueError):
             raise ValidationError(
                 detail=f'Except field {self.name} is a {self.OBJ_TYPE} value'
@@ -471,6 +593,8 @@ class Date(DateTime):
     :param format: Either ``"iso"`` (for ISO8601) or a date format string. If `None`, defaults to "iso".
     """
 
+    __slots__ = ()
+
     DESERIALIZATION_FUNCS = {
         "iso": utils.from_iso_date,
         "iso8601": utils.from_iso_date
@@ -495,6 +619,8 @@ class Url(String):
     :param kwargs: The same keyword arguments that :class:`String` receives.
     """
 
+    __slots__ = ()
+
     def __init__(self, *, schemes: types.StrSequenceOrSet | None = None, **kwargs,):
         super().__init__(**kwargs)
 
@@ -509,6 +635,8 @@ class Url(String):
 class Email(String):
     """An email field."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Insert validation into self.validators so that multiple errors can be stored.
@@ -517,6 +645,8 @@ class Email(String):
 
 
 class Password(String):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         validator = validate.Password()
@@ -1,11 +1,16 @@
 """The :class:`Schema` class, including its metaclass and options (class Meta)."""
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 import copy
 import inspect
+import itertools
+import os
+import sys
+import threading
 import typing
+from types import FunctionType
 
 from . import base, fields as ma_fields, class_registry, types
 from rest_framework.exceptions import ValidationError
@@ -19,7 +24,23 @@ from .utils import (
 
 
 VALIDATES = 'validates'
-_T = typing.TypeVar("_T")
+
+#: Minimum number of records for a ``Meta.parallel`` schema to load them in threads
+PARALLEL_THRESHOLD = 1024
+
+_executor = None  # type: ThreadPoolExecutor | None
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by parallel schemas, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _executor
 
 
 def _get_fields(attrs):
@@ -44,16 +65,61 @@ def _get_fields_by_mro(klass):
     :param type klass: Class whose fields to retrieve
     """
     mro = inspect.getmro(klass)
+    fields = []
     # Loop over mro in reverse to maintain correct order of fields
-    return sum(
-        (
-            _get_fields(
-                getattr(base, "_declared_fields", base.__dict__),
-            )
-            for base in mro[:0:-1]
-        ),
-        [],
-    )
+    for base in mro[:0:-1]:
+        fields.extend(
+            _get_fields(getattr(base, "_declared_fields", base.__dict__))
+        )
+    return fields
+
+
+def _compile_deserializer(field_names):
+    """Generate a function deserializing a single mapping with the given fields.
+
+    The field loop is unrolled so that loading a record does not iterate over
+    ``load_fields`` nor look up each field again. Field names and helpers are
+    bound as keyword-only defaults, and ``data.get`` is fetched once, so the
+    body only reads locals. The field objects default to `None`; see
+    :func:`_bind_deserializer`.
+
+    :param tuple field_names: Names of the load fields
+    """
+    namespace = {"_missing": missing, "_set_value": set_value}
+    params = ["_missing=_missing", "_set_value=_set_value"]
+    body = ["    ret_d = {}", "    get = data.get"]
+    for idx, field_name in enumerate(field_names):
+        namespace["_n%d" % idx] = field_name
+        params.append("_n%d=_n%d, _f%d=None" % (idx, idx, idx))
+        body.append(
+            "    value = _f%d.deserialize(get(_n%d, _missing), _n%d, data)"
+            % (idx, idx, idx)
+        )
+        body.append("    if value is not _missing:")
+        if "." in field_name:
+            body.append("        _set_value(ret_d, _n%d, value)" % idx)
+        else:
+            body.append("        ret_d[_n%d] = value" % idx)
+    body.append("    return ret_d")
+    header = "def _fast_deserialize(data, *, %s):" % ", ".join(params)
+    source = "\n".join([header] + body)
+    exec(compile(source, "<schema deserializer>", "exec"), namespace)
+    return namespace["_fast_deserialize"]
+
+
+def _bind_deserializer(template, field_objs):
+    """Copy a function made by :func:`_compile_deserializer`, binding the
+    given field objects as its keyword-only defaults.
+
+    :param function template: Compiled deserializer for the field names
+    :param tuple field_objs: Bound field objects, parallel to the field names
+    """
+    func = FunctionType(template.__code__, template.__globals__, template.__name__)
+    kwdefaults = dict(template.__kwdefaults__)
+    for idx, field_obj in enumerate(field_objs):
+        kwdefaults["_f%d" % idx] = field_obj
+    func.__kwdefaults__ = kwdefaults
+    return func
 
 
 class SchemaMeta(type):
@@ -86,36 +152,22 @@ class SchemaMeta(type):
         if name:
             class_registry.register(name, cls)
         cls._hooks = cls.resolve_hooks()
+        # Merge error messages along the MRO once per class
+        merged_error_messages = {}
+        merged_error_messages.update(getattr(cls, "_default_error_messages", {}))
+        for klass in reversed(cls.__mro__):
+            merged_error_messages.update(getattr(klass, "error_messages", {}))
+        cls._merged_error_messages = merged_error_messages
+        # Compiled deserializers by field names, shared by the instances
+        cls._deserializer_templates = {}
 
     def resolve_hooks(cls) -> dict[types.Tag, list[str]]:
         """Add in the decorated processors
 
-        By doing this after constructing the class, we let standard inheritance
-        do all the hard work.
+        No processor decorators are supported, so there is nothing to collect
+        from the class attributes.
         """
-        mro = inspect.getmro(cls)
-
-        # type: typing.Dict[types.Tag, typing.List[str]]
-        hooks = defaultdict(list)
-
-        for attr_name in dir(cls):
-            # Need to look up the actual descriptor, not whatever might be
-            # bound to the class. This needs to come from the __dict__ of the
-            # declaring class.
-            for parent in mro:
-                try:
-                    parent.__dict__[attr_name]
-                except KeyError:
-                    continue
-                else:
-                    break
-            else:
-                # In case we didn't find the attribute and didn't break above.
-                # We should never hit this - it's just here for completeness
-                # to exclude the possibility of attr being undefined.
-                continue
-
-        return hooks
+        return {}
 
 
 class Schema(base.SchemaABC, metaclass=SchemaMeta):  # type:ignore
@@ -133,6 +185,8 @@ class Schema(base.SchemaABC, metaclass=SchemaMeta):  # type:ignore
 
     _declared_fields = {}  # type: typing.Dict[str, ma_fields.Field]
     _hooks = {}  # type: typing.Dict[types.Tag, typing.List[str]]
+    _merged_error_messages = {}  # type: typing.Dict[str, str]
+    _deserializer_templates = {}  # type: typing.Dict[typing.Tuple[str, ...], typing.Callable]
 
     class Meta:
         """Options object for a Schema.
@@ -144,36 +198,47 @@ class Schema(base.SchemaABC, metaclass=SchemaMeta):  # type:ignore
                 exclude = ("password", "secret_attribute")
 
         Available options:
+
+        - ``parallel``: If `True`, collections of at least ``PARALLEL_THRESHOLD``
+          records are loaded in chunks on a shared thread pool.
         """
 
     def __init__(self, *, many: bool = False):
         # Raise error if only or exclude is passed as string, not list of strings
-        self.declared_fields = copy.deepcopy(self._declared_fields)
+        # Fields deep-copy as shallow copies, so copy them directly
+        self.declared_fields = {
+            field_name: copy.copy(field_obj)
+            for field_name, field_obj in self._declared_fields.items()
+        }
         self.many = many
         #: Dictionary mapping field_names -> :class:`Field` objects
         self.load_fields = {}  # type: typing.Dict[str, ma_fields.Field]
         self._init_fields()
-        messages = {}
-        messages.update(self._default_error_messages)
-        for cls in reversed(self.__class__.__mro__):
-            messages.update(getattr(cls, "error_messages", {}))
-        messages.update(self.error_messages or {})
-        self.error_messages = messages
+        self.error_messages = {
+            **self._merged_error_messages,
+            **(self.error_messages or {}),
+        }
+
+    def __getstate__(self):
+        # The generated deserializer cannot be pickled; rebuilt on unpickling
+        state = self.__dict__.copy()
+        state.pop("_fast_deserialize", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._fast_deserialize = self._build_deserializer()
 
     def _deserialize(
         self,
         data: types.MapingOrIterableMapping,
         *,
         many: bool = False,
-        index=None,
     ):
         """Deserialize ``data``.
 
         :param dict data: The data to deserialize.
-        :param ErrorStore error_store: Structure to store errors.
         :param bool many: `True` if ``data`` should be deserialized as a collection.
-        :param int index: Index of the item being serialized (for storing errors) if
-            serializing a collection, otherwise `None`.
         :return: A dictionary of the deserialized data.
         """
         if many:
@@ -181,34 +246,55 @@ class Schema(base.SchemaABC, metaclass=SchemaMeta):  # type:ignore
                 raise ValidationError(
                     detail='Except data is an iterable value'
                 )
-            else:
-                ret_l = [
-                    typing.cast(
-                        _T,
-                        self._deserialize(
-                            typing.cast(typing.Mapping[str, typing.Any], d),
-                            many=False,
-                            index=idx,
-                        ),
-                    )
-                    for idx, d in enumerate(data)
-                ]
-            return ret_l
-        ret_d = dict()
+            if (
+                getattr(self.Meta, "parallel", False)
+                and isinstance(data, (list, tuple))
+                and len(data) >= PARALLEL_THRESHOLD
+                and not getattr(_worker_state, "active", False)
+            ):
+                return self._deserialize_parallel(data)
+            deserialize_one = self._deserialize_one
+            return [deserialize_one(d) for d in data]
+        return self._deserialize_one(data)
+
+    def _deserialize_parallel(self, data: typing.Sequence[typing.Any]):
+        """Deserialize a sequence of records in contiguous chunks on the shared
+        thread pool. The first error in record order is raised.
+
+        :param data: The records to deserialize.
+        :return: A list of the deserialized records.
+        """
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(data) // workers)
+        deserialize_one = self._deserialize_one
+
+        def run(chunk):
+            # Nested parallel schemas load inline to avoid waiting on the pool
+            _worker_state.active = True
+            try:
+                return [deserialize_one(d) for d in chunk]
+            finally:
+                _worker_state.active = False
+
+        executor = _get_executor()
+        futures = [
+            executor.submit(run, data[start:start + chunk_size])
+            for start in range(0, len(data), chunk_size)
+        ]
+        return list(
+            itertools.chain.from_iterable(future.result() for future in futures)
+        )
+
+    def _deserialize_one(self, data: typing.Mapping[str, typing.Any]):
+        """Deserialize a single mapping of ``data``.
+
+        :param dict data: The data to deserialize.
+        :return: A dictionary of the deserialized data.
+        """
         # Check data is a dict
         if not isinstance(data, Mapping):
             raise ValidationError(detail='Except data is an objects')
-        else:
-            for field_name, field_obj in self.load_fields.items():
-                value = field_obj.deserialize(
-                    data.get(field_name, missing),  # type:ignore
-                    field_name,
-                    data
-                )
-
-                if value is not missing:
-                    set_value(ret_d, field_name, value)
-        return ret_d
+        return self._fast_deserialize(data)
 
     def load(self, data: types.MapingOrIterableMapping, *, many: bool | None = None,):
         """Deserialize a data structure to an object defined by this Schema's fields.
@@ -225,11 +311,26 @@ class Schema(base.SchemaABC, metaclass=SchemaMeta):  # type:ignore
 
     def _init_fields(self) -> None:
         fields_dict = dict()
-        for field_name in self.declared_fields.keys():
-            field_obj = self.declared_fields.get(field_name, ma_fields.Field())
+        for field_name, field_obj in self.declared_fields.items():
             field_obj._bind_to_schema(field_name, self)
             fields_dict[field_name] = field_obj
-        self.load_fields = dict(fields_dict.items())
+        self.load_fields = fields_dict
+        # Parallel name/field tuples; interned names speed up ``data.get``
+        self._field_names = tuple(sys.intern(name) for name in fields_dict)
+        self._field_objs = tuple(fields_dict.values())
+        self._fast_deserialize = self._build_deserializer()
+
+    def _build_deserializer(self):
+        """Return the deserializer for the bound fields, compiling it only once
+        per schema class and set of field names.
+        """
+        templates = self._deserializer_templates
+        template = templates.get(self._field_names)
+        if template is None:
+            template = templates[self._field_names] = _compile_deserializer(
+                self._field_names
+            )
+        return _bind_deserializer(template, self._field_objs)
 
 
 BaseSchema = Schema  # for backwards compatibility
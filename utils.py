@@ -5,7 +5,9 @@ import functools
 import inspect
 import re
 import typing
+import weakref
 from collections.abc import Mapping
+from types import GeneratorType
 
 from rest_framework.exceptions import APIException
 
@@ -13,6 +15,8 @@ from .base import FieldABC
 
 
 class _Missing:
+    __slots__ = ()
+
     def __bool__(self):
         return False
 
@@ -22,6 +26,13 @@ class _Missing:
     def __deepcopy__(self, _):
         return self
 
+    def __reduce__(self):
+        # Unpickle to the module-level singleton
+        return "missing"
+
+    def __repr__(self):
+        return "<missing>"
+
 
 # Singleton value that indicates that a field's value is missing from input
 # dict passed to :meth:`Schema.load`. If the field's value is not required,
@@ -29,13 +40,31 @@ class _Missing:
 missing = _Missing()
 
 
+# Whether instances of a type are iterable but not string-like, by type
+_ITERABLE_TYPES = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+# Whether instances of a type support ``obj[key]``, by type
+_GETITEM_TYPES = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
 def is_generator(obj) -> bool:
     """Return True if ``obj`` is a generator"""
-    return inspect.isgeneratorfunction(obj) or inspect.isgenerator(obj)
+    if isinstance(obj, GeneratorType):
+        return True
+    code = getattr(obj, "__code__", None)
+    if code is not None:
+        return bool(code.co_flags & inspect.CO_GENERATOR)
+    # Let inspect unwrap partials
+    return isinstance(obj, functools.partial) and inspect.isgeneratorfunction(obj)
 
 
 def is_iterable_but_not_string(obj) -> bool:
-    return (hasattr(obj, "__iter__") and not hasattr(obj, "strip")) or is_generator(obj)
+    obj_type = type(obj)
+    iterable = _ITERABLE_TYPES.get(obj_type)
+    if iterable is None:
+        iterable = _ITERABLE_TYPES[obj_type] = (
+            hasattr(obj_type, "__iter__") and not hasattr(obj_type, "strip")
+        )
+    return iterable or is_generator(obj)
 
 
 def is_collection(obj) -> bool:
@@ -69,18 +98,122 @@ def get_fixed_timezone(offset: int | float | dt.timedelta) -> dt.timezone:
     """Return a tzinfo instance with a fixed offset from UTC."""
     if isinstance(offset, dt.timedelta):
         offset = offset.total_seconds() // 60
+    return _fixed_timezone(offset)
+
+
+@functools.lru_cache(maxsize=256)
+def _fixed_timezone(offset: int | float) -> dt.timezone:
+    """Build the timezone for an offset in minutes, shared by all parsed values."""
     sign = "-" if offset < 0 else "+"
     hhmm = "%02d%02d" % divmod(abs(offset), 60)
     name = sign + hhmm
     return dt.timezone(dt.timedelta(minutes=offset), name)
 
 
+def _looks_like_date(value: str) -> bool:
+    """Cheap check that ``value`` starts like ``YYYY-M-D``, the shortest
+    prefix accepted by the ISO8601 date and datetime parsers.
+    """
+    return len(value) >= 8 and value[4] == "-" and value[:4].isdigit()
+
+
+def _scan_iso_time(value: str, pos: int):
+    """Scan ``HH:MM[:SS[.ffffff]]`` at fixed offsets starting at ``pos``.
+
+    Return ``(hour, minute, second, microsecond, end)``, or `None` if ``value``
+    does not follow that layout.
+    """
+    n = len(value)
+    hour = value[pos:pos + 2]
+    minute = value[pos + 3:pos + 5]
+    if (
+        n < pos + 5
+        or value[pos + 2] != ":"
+        or not hour.isdigit()
+        or not minute.isdigit()
+    ):
+        return None
+    second = microsecond = 0
+    end = pos + 5
+    if end < n and value[end] == ":":
+        digits = value[end + 1:end + 3]
+        if len(digits) != 2 or not digits.isdigit():
+            return None
+        second = int(digits)
+        end += 3
+        if end < n and value[end] == ".":
+            start = end = end + 1
+            while end < n and value[end].isdigit():
+                end += 1
+            # Up to 12 digits are accepted, anything past 6 is dropped
+            if not 0 < end - start <= 12:
+                return None
+            microsecond = int(value[start:min(end, start + 6)].ljust(6, "0"))
+    return int(hour), int(minute), second, microsecond, end
+
+
+def _scan_iso_tzinfo(value: str, pos: int):
+    """Scan the ``Z``/``+HH[[:]MM]``/``-HH[[:]MM]`` suffix of ``value`` from ``pos``.
+
+    Return the tzinfo (`None` for naive values), or ``False`` if the suffix is
+    not recognized.
+    """
+    tail = value[pos:]
+    if not tail:
+        return None
+    if tail == "Z":
+        return dt.timezone.utc
+    sign, rest = tail[0], tail[1:]
+    if sign not in "+-":
+        return False
+    if len(rest) == 5 and rest[2] == ":":
+        rest = rest[:2] + rest[3:]
+    if len(rest) not in (2, 4) or not rest.isdigit():
+        return False
+    offset = 60 * int(rest[:2]) + (int(rest[2:]) if len(rest) == 4 else 0)
+    return get_fixed_timezone(-offset if sign == "-" else offset)
+
+
+def _scan_iso_datetime(value):
+    """Parse ``YYYY-MM-DD[T ]HH:MM[:SS[.ffffff]][tz]`` at fixed offsets.
+
+    Return `None` if ``value`` does not follow that layout.
+    """
+    if (
+        len(value) < 16
+        or not value.isascii()
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] not in "T "
+    ):
+        return None
+    year, month, day = value[:4], value[5:7], value[8:10]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    time = _scan_iso_time(value, 11)
+    if time is None:
+        return None
+    hour, minute, second, microsecond, end = time
+    tzinfo = _scan_iso_tzinfo(value, end)
+    if tzinfo is False:
+        return None
+    return dt.datetime(
+        int(year), int(month), int(day), hour, minute, second, microsecond, tzinfo
+    )
+
+
 def from_iso_datetime(value):
     """Parse a string and return a datetime.datetime.
 
     This function supports time zone offsets. When the input contains one,
     the output uses a timezone with a fixed offset from UTC.
     """
+    if not _looks_like_date(value):
+        raise ValueError("Not a valid ISO8601-formatted datetime string")
+    parsed = _scan_iso_datetime(value)
+    if parsed is not None:
+        return parsed
+    # Less common layouts, such as single-digit months
     match = _iso8601_datetime_re.match(value)
     if not match:
         raise ValueError("Not a valid ISO8601-formatted datetime string")
@@ -105,6 +238,10 @@ def from_iso_time(value):
 
     This function doesn't support time zone offsets.
     """
+    if value.isascii():
+        time = _scan_iso_time(value, 0)
+        if time is not None and time[4] == len(value):
+            return dt.time(*time[:4])
     match = _iso8601_time_re.match(value)
     if not match:
         raise ValueError("Not a valid ISO8601-formatted time string")
@@ -116,6 +253,18 @@ def from_iso_time(value):
 
 def from_iso_date(value):
     """Parse a string and return a datetime.date."""
+    if not _looks_like_date(value):
+        raise ValueError("Not a valid ISO8601-formatted date string")
+    if (
+        len(value) == 10
+        and value.isascii()
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        return dt.date(int(value[:4]), int(value[5:7]), int(value[8:]))
     match = _iso8601_date_re.match(value)
     if not match:
         raise ValueError("Not a valid ISO8601-formatted date string")
@@ -140,6 +289,11 @@ def to_iso_date(date: dt.date) -> str:
 
 
 def ensure_text_type(val: str | bytes) -> str:
+    val_type = type(val)
+    if val_type is str:
+        return val
+    if val_type is bytes:
+        return val.decode("utf-8")
     if isinstance(val, bytes):
         val = val.decode("utf-8")
     return str(val)
@@ -157,22 +311,33 @@ def get_value(obj, key: int | str, default=missing):
         `fields.Field.get_value` in this case.
     """
     if not isinstance(key, int) and "." in key:
-        return _get_value_for_keys(obj, key.split("."), default)
+        return _get_value_for_keys(obj, _split_key(key), default)
     else:
         return _get_value_for_key(obj, key, default)
 
 
+@functools.lru_cache(maxsize=4096)
+def _split_key(key: str) -> tuple[str, ...]:
+    """Split a dot-delimited key, caching the result since keys are reused."""
+    return tuple(key.split("."))
+
+
 def _get_value_for_keys(obj, keys, default):
-    if len(keys) == 1:
-        return _get_value_for_key(obj, keys[0], default)
-    else:
-        return _get_value_for_keys(
-            _get_value_for_key(obj, keys[0], default), keys[1:], default
-        )
+    for key in keys:
+        obj = _get_value_for_key(obj, key, default)
+        if obj is default:
+            return default
+    return obj
 
 
 def _get_value_for_key(obj, key, default):
-    if not hasattr(obj, "__getitem__"):
+    obj_type = type(obj)
+    if obj_type is dict:
+        return obj.get(key, default)
+    has_getitem = _GETITEM_TYPES.get(obj_type)
+    if has_getitem is None:
+        has_getitem = _GETITEM_TYPES[obj_type] = hasattr(obj_type, "__getitem__")
+    if not has_getitem:
         return getattr(obj, key, default)
 
     try:
@@ -192,23 +357,59 @@ def set_value(dct: dict[str, typing.Any], key: str, value: typing.Any):
         >>> d
         {'foo': {'bar': 42}}
     """
-    if "." in key:
-        head, rest = key.split(".", 1)
-        target = dct.setdefault(head, {})
+    if "." not in key:
+        dct[key] = value
+        return
+    parts = _split_key(key)
+    target = dct
+    for idx in range(len(parts) - 1):
+        head = parts[idx]
+        target = target.setdefault(head, {})
         if not isinstance(target, dict):
             raise ValueError(
                 "Cannot set {key} in {head} "
                 "due to existing value: {target}".format(
-                    key=key, head=head, target=target
+                    key=".".join(parts[idx:]), head=head, target=target
                 )
             )
-        set_value(target, rest, value)
-    else:
-        dct[key] = value
+    target[parts[-1]] = value
+
+
+# Parameter names per callable, dropped along with the callable
+_signature_cache = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
 
 
 def _signature(func: typing.Callable) -> list[str]:
-    return list(inspect.signature(func).parameters.keys())
+    try:
+        return list(_signature_cache[func])
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable or not weakly referenceable callable
+        return list(inspect.signature(func).parameters.keys())
+    args = tuple(inspect.signature(func).parameters.keys())
+    _signature_cache[func] = args
+    return list(args)
+
+
+@functools.lru_cache(maxsize=1024)
+def _code_args(code) -> tuple[str, ...]:
+    """Return parameter names from a code object, in `inspect.signature` order."""
+    names = code.co_varnames
+    end = code.co_argcount + code.co_kwonlyargcount
+    args = list(names[:code.co_argcount])
+    if code.co_flags & inspect.CO_VARARGS:
+        args.append(names[end])
+        end += 1
+    args.extend(names[code.co_argcount:code.co_argcount + code.co_kwonlyargcount])
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        args.append(names[end])
+    return tuple(args)
+
+
+def _has_plain_signature(func) -> bool:
+    # Wrapped functions and explicit signatures need `inspect.signature`
+    return not hasattr(func, "__wrapped__") and not hasattr(func, "__signature__")
 
 
 def get_func_args(func: typing.Callable) -> list[str]:
@@ -218,10 +419,21 @@ def get_func_args(func: typing.Callable) -> list[str]:
     .. versionchanged:: 3.0.0a1
         Do not return bound arguments, eg. ``self``.
     """
+    if inspect.isfunction(func) and _has_plain_signature(func):
+        return list(_code_args(func.__code__))
+    if (
+        inspect.ismethod(func)
+        and inspect.isfunction(func.__func__)
+        and _has_plain_signature(func.__func__)
+    ):
+        code = func.__func__.__code__
+        args = _code_args(code)
+        # The bound instance fills the first positional argument, if any
+        return list(args[1:] if code.co_argcount else args)
     if inspect.isfunction(func) or inspect.ismethod(func):
         return _signature(func)
     if isinstance(func, functools.partial):
-        return _signature(func.func)
+        return get_func_args(func.func)
     # Callable class
     return _signature(func)
 
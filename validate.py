@@ -1,7 +1,9 @@
 """Validation classes for various types of data."""
 from __future__ import annotations
 
+import functools
 import re
+import string
 import typing
 from abc import ABC, abstractmethod
 from itertools import zip_longest
@@ -13,6 +15,37 @@ from rest_framework.exceptions import ValidationError
 _T = typing.TypeVar("_T")
 
 
+@functools.lru_cache(maxsize=512)
+def _field_message(template: str, name: str | None, **kwargs) -> str:
+    """Format an error message template, sharing the result between failures
+    of fields with the same name.
+    """
+    return template.format(name=name, **kwargs)
+
+
+def _as_frozenset(values) -> frozenset | None:
+    """Return a frozenset of ``values`` for hashed lookups, or `None` if
+    ``values`` is not a plain collection or holds unhashable items.
+    """
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        return None
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
+def _contains(values, values_set, value) -> bool:
+    """Return ``value in values``, probing ``values_set`` first when available."""
+    if values_set is not None:
+        try:
+            return value in values_set
+        except TypeError:
+            # Unhashable value, compare against each item instead
+            pass
+    return value in values
+
+
 class Validator(ABC):
     """Abstract base class for validators.
 
@@ -42,12 +75,16 @@ class And(Validator):
     """
 
     def __init__(self, *validators: types.Validator):
-        self.validators = tuple(validators)
+        # ``*validators`` is already a tuple
+        self.validators = validators
+        self._is_validator = tuple(
+            isinstance(validator, Validator) for validator in validators
+        )
 
     def __call__(self, value: typing.Any, name: str) -> typing.Any:
-        for validator in self.validators:
+        for validator, is_validator in zip(self.validators, self._is_validator):
             r = validator(value, name)
-            if not isinstance(validator, Validator) and r is False:
+            if not is_validator and r is False:
                 raise ValidationError(
                     detail='Invalid arguments'
                 )
@@ -68,12 +105,14 @@ class URL(Validator):
     class RegexMemoizer:
         def __init__(self):
             self._memoized = {}
+            # Compile the common configurations up front
+            for key in ((False, True), (True, True)):
+                self._memoized[key] = self._regex_generator(*key)
 
         def _regex_generator(self, relative: bool, require_tld: bool) -> typing.Pattern:
             return re.compile(
                 r"".join(
                     (
-                        r"^",
                         r"(" if relative else r"",
                         # scheme is validated separately
                         r"(?:[a-z0-9\.\-\+]*)://",
@@ -92,7 +131,7 @@ class URL(Validator):
                         r")?"
                         if relative
                         else r"",  # host is optional, allow for relative URLs
-                        r"(?:/?|[/?]\S+)\Z",
+                        r"(?:/?|[/?]\S+)",  # anchored by fullmatch
                     )
                 ),
                 re.IGNORECASE,
@@ -100,16 +139,19 @@ class URL(Validator):
 
         def __call__(self, relative: bool, require_tld: bool) -> typing.Pattern:
             key = (relative, require_tld)
-            if key not in self._memoized:
-                self._memoized[key] = self._regex_generator(
+            try:
+                return self._memoized[key]
+            except KeyError:
+                regex = self._memoized[key] = self._regex_generator(
                     relative, require_tld)
-
-            return self._memoized[key]
+                return regex
 
     _regex = RegexMemoizer()
 
     default_schemes = {"http", "https", "ftp", "ftps"}
 
+    default_message = "Field {name} must be a valid url"
+
     def __init__(
         self,
         *,
@@ -118,20 +160,24 @@ class URL(Validator):
         require_tld: bool = True,
     ):
         self.relative = relative
-        self.schemes = schemes or self.default_schemes
+        self.schemes = frozenset(
+            scheme.lower() for scheme in (schemes or self.default_schemes)
+        )
         self.require_tld = require_tld
 
     def __call__(self, value: str, name: str) -> str:
-        message = f'Field {name} must be a valid url'
-        if "://" in value:
-            scheme = value.split("://")[0].lower()
-            if scheme not in self.schemes:
-                raise ValidationError(message)
+        scheme, sep, _ = value.partition("://")
+        if sep:
+            if scheme.lower() not in self.schemes:
+                raise ValidationError(_field_message(self.default_message, name))
+        elif not self.relative:
+            # Absolute URLs need a scheme, no need to run the regex
+            raise ValidationError(_field_message(self.default_message, name))
 
         regex = self._regex(self.relative, self.require_tld)
 
-        if not regex.search(value):
-            raise ValidationError(message)
+        if not regex.fullmatch(value):
+            raise ValidationError(_field_message(self.default_message, name))
 
         return value
 
@@ -160,29 +206,57 @@ class Email(Validator):
         re.IGNORECASE | re.UNICODE,
     )
 
-    DOMAIN_WHITELIST = ("localhost",)
+    DOMAIN_WHITELIST = frozenset(("localhost",))
 
-    def __call__(self, value: str, name: str) -> str:
-        message = "Field {name} must be an valid email".format(name=name)
+    default_message = "Field {name} must be an valid email"
+
+    # ASCII characters allowed in a dot-atom user part
+    USER_CHARSET = frozenset(
+        string.ascii_letters + string.digits + "-!#$%&'*+/=?^`{}|~._"
+    )
 
+    _user_match = USER_REGEX.match
+    _domain_match = DOMAIN_REGEX.match
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._user_match = cls.USER_REGEX.match
+        cls._domain_match = cls.DOMAIN_REGEX.match
+
+    def _is_valid_user(self, user_part: str) -> bool:
+        # Plain ASCII dot-atoms are checked without the regex
+        if (
+            self.USER_CHARSET.issuperset(user_part)
+            and user_part[:1] not in ("", ".")
+            and user_part[-1] != "."
+            and ".." not in user_part
+        ):
+            return True
+        return self._user_match(user_part) is not None
+
+    def __call__(self, value: str, name: str) -> str:
         if not value or "@" not in value:
-            raise ValidationError(detail=message)
+            raise ValidationError(
+                detail=_field_message(self.default_message, name)
+            )
 
-        user_part, domain_part = value.rsplit("@", 1)
+        user_part, _, domain_part = value.rpartition("@")
 
-        if not self.USER_REGEX.match(user_part):
-            raise ValidationError(detail=message)
+        if not self._is_valid_user(user_part):
+            raise ValidationError(
+                detail=_field_message(self.default_message, name)
+            )
 
         if domain_part not in self.DOMAIN_WHITELIST:
-            if not self.DOMAIN_REGEX.match(domain_part):
+            if not self._domain_match(domain_part):
                 try:
                     domain_part = domain_part.encode("idna").decode("ascii")
                 except UnicodeError:
                     pass
                 else:
-                    if self.DOMAIN_REGEX.match(domain_part):
+                    if self._domain_match(domain_part):
                         return value
-                raise ValidationError(message)
+                raise ValidationError(_field_message(self.default_message, name))
 
         return value
 
@@ -192,30 +266,43 @@ class Password(Validator):
     UPPERCASE_PATTERN = '[A-Z]'
     SPECIAL_CHARACTERS = r'[.@_!#$%^&*()<>?/\|}{~:]'
 
+    # Compiled once per class from the patterns above
+    _uppercase_re = re.compile(UPPERCASE_PATTERN)
+    _special_re = re.compile(SPECIAL_CHARACTERS)
+
+    message_too_short = "Field {name} is too short"
+    message_numeric = "Field {name} entirely numeric"
+    message_number = "Field {name} must contain number"
+    message_uppercase = "Field {name} must contain uppercase characters"
+    message_special = "Field {name} must contain special characters"
+
     def __init__(self, *, length_min=8, contain_number: bool = True, cotain_uppercase: bool = False, contain_special: bool = False):
         self.cotain_number = contain_number
         self.cotain_uppercase = cotain_uppercase
         self.cotain_special = contain_special
         self.length_min = length_min
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._uppercase_re = re.compile(cls.UPPERCASE_PATTERN)
+        cls._special_re = re.compile(cls.SPECIAL_CHARACTERS)
+
     @classmethod
     def has_only_number(cls, input):
         return input.isdecimal()
 
     @classmethod
     def has_number(cls, input):
-        return any(letter.isnumeric() or letter.isdigit() for letter in input)
+        # Digits are a subset of numeric characters
+        return any(map(str.isnumeric, input))
 
     @classmethod
     def has_uppercase_character(cls, input):
-        return bool(re.match(cls.UPPERCASE_PATTERN, input))
+        return cls._uppercase_re.match(input) is not None
 
     @classmethod
     def has_special_character(cls, input):
-        regex = re.compile(cls.SPECIAL_CHARACTERS)
-        if (regex.search(input)):
-            return True
-        return False
+        return cls._special_re.search(input) is not None
 
     def __call__(self, value: str, name: str) -> str:
 
@@ -223,21 +310,19 @@ class Password(Validator):
         value = str(value)
 
         if len(value) < self.length_min:
-            errors.append(f'Field {name} is too short')
+            errors.append(_field_message(self.message_too_short, name))
 
         if self.has_only_number(value):
-            errors.append(f'Field {name} entirely numeric')
+            errors.append(_field_message(self.message_numeric, name))
 
-        if self.cotain_number and (not self.has_number(value)):
-            errors.append(f'Field {name} must contain number')
+        if self.cotain_number and not self.has_number(value):
+            errors.append(_field_message(self.message_number, name))
 
-        if self.cotain_uppercase and (not self.has_uppercase_character(value)):
-            errors.append(f'Field {name} must contain uppercase characters')
+        if self.cotain_uppercase and not self.has_uppercase_character(value):
+            errors.append(_field_message(self.message_uppercase, name))
 
-        if self.cotain_special and (not self.has_special_character(value)):
-            errors.append(
-                f'Field {name} must contain special characters'
-            )
+        if self.cotain_special and not self.has_special_character(value):
+            errors.append(_field_message(self.message_special, name))
 
         if errors:
             raise ValidationError(detail=errors)
@@ -248,21 +333,29 @@ class Password(Validator):
 class OneOfEnum(Validator):
     def __init__(self, *, enum_class):
         self.enum_class = enum_class
+        # Enum members are fixed, look them up once
+        self._keys = list(enum_class.__members__)
+        self._keys_set = frozenset(self._keys)
+        self._values = [member.value for member in enum_class.__members__.values()]
+        self._values_set = _as_frozenset(self._values)
 
     def __call__(self, value: str, name: str) -> str | None:
         value = value.upper()
 
-        keys = [v for v in self.enum_class.__members__.keys()]
-        if value in keys:
+        if value in self._keys_set:
             return self.enum_class[value]
-        elif value in [v.value for v in self.enum_class.__members__.values()]:
+        elif _contains(self._values, self._values_set, value):
             return value
         else:
             raise ValidationError(
-                detail=f'Field {name} must be one of: {keys}'
+                detail=f'Field {name} must be one of: {self._keys}'
             )
 
 
+# Range messages interpolated for each (class, min_inclusive, max_inclusive)
+_RANGE_MESSAGES = {}  # type: dict[tuple[type, bool, bool], tuple[str, str, str]]
+
+
 class Range(Validator):
     """Validator which succeeds if the value passed to it is within the specified
     range. If ``min`` is not specified, or is specified as `None`,
@@ -306,16 +399,20 @@ class Range(Validator):
         self.min_inclusive = min_inclusive
         self.max_inclusive = max_inclusive
 
-        # interpolate messages based on bound inclusivity
-        self.message_min = self.message_min.format(
-            min_op=self.message_gte if self.min_inclusive else self.message_gt
-        )
-        self.message_max = self.message_max.format(
-            max_op=self.message_lte if self.max_inclusive else self.message_lt
-        )
-        self.message_all = self.message_all.format(
-            min_op=self.message_gte if self.min_inclusive else self.message_gt,
-            max_op=self.message_lte if self.max_inclusive else self.message_lt,
+        # interpolate messages based on bound inclusivity, once per class
+        key = (type(self), self.min_inclusive, self.max_inclusive)
+        messages = _RANGE_MESSAGES.get(key)
+        if messages is None:
+            messages = _RANGE_MESSAGES[key] = self._interpolate_messages()
+        self.message_min, self.message_max, self.message_all = messages
+
+    def _interpolate_messages(self) -> tuple[str, str, str]:
+        min_op = self.message_gte if self.min_inclusive else self.message_gt
+        max_op = self.message_lte if self.max_inclusive else self.message_lt
+        return (
+            self.message_min.format(min_op=min_op),
+            self.message_max.format(max_op=max_op),
+            self.message_all.format(min_op=min_op, max_op=max_op),
         )
 
     def _format_error(self, value, name: str, message: str) -> str:
@@ -473,13 +570,14 @@ class NoneOf(Validator):
         self.iterable = iterable
         self.values_text = ", ".join(str(each) for each in self.iterable)
         self.error = error or self.default_message  # type: str
+        self._iterable_set = _as_frozenset(iterable)
 
     def _format_error(self, value) -> str:
         return self.error.format(input=value, values=self.values_text)
 
     def __call__(self, value: typing.Any, name: str) -> typing.Any:
         try:
-            if value in self.iterable:
+            if _contains(self.iterable, self._iterable_set, value):
                 raise ValidationError(detail=self._format_error(value))
         except TypeError:
             pass
@@ -496,6 +594,8 @@ class OneOf(Validator):
         interpolated with `{input}`, `{choices}` and `{labels}`.
     """
 
+    default_message = "Field {name} must be one of: {choices}"
+
     def __init__(
         self,
         choices: typing.Iterable,
@@ -503,15 +603,17 @@ class OneOf(Validator):
     ):
         self.choices = choices
         self.choices_text = ", ".join(str(choice) for choice in self.choices)
+        self._choices_set = _as_frozenset(choices)
         self.labels = labels if labels is not None else []
         self.labels_text = ", ".join(str(label) for label in self.labels)
+        self._pairs = tuple(zip_longest(self.choices, self.labels, fillvalue=""))
 
     def _format_error(self, value, name) -> str:
-        return f'Field {name} must be one of: {self.choices_text}'
+        return _field_message(self.default_message, name, choices=self.choices_text)
 
     def __call__(self, value: typing.Any, name: str) -> typing.Any:
         try:
-            if value not in self.choices:
+            if not _contains(self.choices, self._choices_set, value):
                 raise ValidationError(detail=self._format_error(value, name))
         except TypeError as error:
             raise ValidationError(
@@ -523,7 +625,7 @@ class OneOf(Validator):
         self,
         valuegetter: str | typing.Callable[[typing.Any], typing.Any] = str,
     ) -> typing.Iterable[tuple[typing.Any, str]]:
-        """Return a generator over the (value, label) pairs, where value
+        """Return a list of the (value, label) pairs, where value
         is a string associated with each choice. This convenience method
         is useful to populate, for instance, a form select field.
 
@@ -535,6 +637,4 @@ class OneOf(Validator):
         """
         valuegetter = valuegetter if callable(
             valuegetter) else attrgetter(valuegetter)
-        pairs = zip_longest(self.choices, self.labels, fillvalue="")
-
-        return ((valuegetter(choice), label) for choice, label in pairs)
+        return [(valuegetter(choice), label) for choice, label in self._pairs]